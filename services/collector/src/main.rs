@@ -29,6 +29,7 @@ use config::Config;
 struct AppState {
     db: sqlx::PgPool,
     redis: redis::Client,
+    redis_events: redis::aio::ConnectionManager,
     config: Arc<Config>,
 }
 
@@ -60,12 +61,15 @@ async fn main() -> anyhow::Result<()> {
     let redis = redis::Client::open(config.redis.url.as_str())?;
     let mut redis_conn = redis.get_connection()?;
     redis::cmd("PING").query::<String>(&mut redis_conn)?;
+    // One auto-reconnecting connection shared by every change-event publish
+    let redis_events = redis::aio::ConnectionManager::new(redis.clone()).await?;
     info!("Connected to Redis");
 
     // Build application state
     let state = AppState {
         db: db.clone(),
         redis: redis.clone(),
+        redis_events,
         config: config.clone(),
     };
 
@@ -1,7 +1,14 @@
 use anyhow::Result;
 use tracing::{info, warn};
 
-use crate::{db, models::{CollectionResult, Platform, PolicySnapshot}, scraper, AppState};
+use crate::{
+    db,
+    models::{CollectionResult, Platform, PolicyChange, PolicySnapshot},
+    scraper, AppState,
+};
+
+/// Redis stream that change subscribers read instead of polling the changes API
+const CHANGE_EVENTS_STREAM: &str = "nuj:changes";
 
 pub async fn collect_platform_policies(
     state: &AppState,
@@ -93,7 +100,7 @@ async fn collect_document(
     if change_detected {
         info!("Change detected in {} for {}", document_type, platform.name);
 
-        db::create_policy_change(
+        let change = db::create_policy_change(
             &state.db,
             doc.id,
             previous_snapshot.map(|s| s.id),
@@ -105,6 +112,14 @@ async fn collect_document(
             )),
         )
         .await?;
+
+        // The change is already stored; a failed publish only delays subscribers
+        if let Err(e) = publish_change_event(state, platform, &change).await {
+            warn!(
+                "Failed to publish change event for {}: {}",
+                platform.name, e
+            );
+        }
     } else {
         info!("No change detected in {} for {}", document_type, platform.name);
     }
@@ -120,6 +135,32 @@ async fn collect_document(
     })
 }
 
+async fn publish_change_event(
+    state: &AppState,
+    platform: &Platform,
+    change: &PolicyChange,
+) -> Result<()> {
+    // Cloning the manager is cheap and reuses its single multiplexed connection
+    let mut conn = state.redis_events.clone();
+    redis::cmd("XADD")
+        .arg(CHANGE_EVENTS_STREAM)
+        .arg("MAXLEN")
+        .arg("~")
+        .arg(10_000)
+        .arg("*")
+        .arg("change_id")
+        .arg(change.id.to_string())
+        .arg("platform_id")
+        .arg(platform.id.to_string())
+        .arg("severity")
+        .arg(&change.severity)
+        .arg("detected_at")
+        .arg(change.detected_at.to_rfc3339())
+        .query_async::<_, String>(&mut conn)
+        .await?;
+    Ok(())
+}
+
 fn extract_urls(json_value: &serde_json::Value) -> Result<Vec<String>> {
     match json_value.as_array() {
         Some(arr) => Ok(arr
@@ -3,12 +3,24 @@ Virtuoso Triple Store Adapter for NUJ Monitor
 Provides RDF/SPARQL interface for semantic policy tracking
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet, AsyncIterator
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import lru_cache
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
 import httpx
+from cachetools import TTLCache
 from rdflib import Graph, Namespace, Literal, URIRef
-from rdflib.namespace import RDF, RDFS, XSD, OWL
+from rdflib.namespace import RDF, RDFS
+from rdflib.term import Identifier
+
+logger = logging.getLogger(__name__)
 
 # NUJ Monitor ontology namespace
 NUJ = Namespace("https://nuj.org.uk/monitor/ontology/")
@@ -16,6 +28,230 @@ PLATFORM = Namespace("https://nuj.org.uk/monitor/platform/")
 POLICY = Namespace("https://nuj.org.uk/monitor/policy/")
 CHANGE = Namespace("https://nuj.org.uk/monitor/change/")
 
+# Plain-string forms used on the hot insert/query paths
+_NUJ_STR, _PLATFORM_STR = str(NUJ), str(PLATFORM)
+_BOOL_N3 = {value: Literal(value).n3() for value in (True, False)}
+
+@lru_cache(maxsize=4096)
+def _uri_n3(namespace: str, local: str) -> str:
+    """N3 form of a namespaced URI, validated by rdflib once per distinct id"""
+    return URIRef(namespace + local).n3()
+
+# Shared HTTP client so the connection pool survives across adapter instances.
+# Pool limits and HTTP/2 live on the transport: httpx ignores the client-level
+# settings once an explicit transport is supplied.
+_client: Optional[httpx.AsyncClient] = None
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the module-level pooled HTTP/2 client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=60
+                ),
+                retries=2
+            )
+        )
+    return _client
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client; the next request opens a fresh one"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+# Prologue: Virtuoso define pragmas and PREFIX declarations, in any order
+_PROLOGUE_DECL = r'define\s+\S+\s+(?:"[^"]*"|\S+)|PREFIX\s+[\w-]*:\s*<[^>]*>'
+
+# SPARQL Update operations are never cached; they invalidate cached reads instead
+_UPDATE_RE = re.compile(
+    rf"^(?:(?:{_PROLOGUE_DECL}|BASE\s+<[^>]*>)\s*)*"
+    r"(?:INSERT|DELETE|CLEAR|LOAD|DROP|CREATE|ADD|MOVE|COPY|WITH)\b",
+    re.IGNORECASE
+)
+_GRAPH_RE = re.compile(r"(?:GRAPH|FROM(?:\s+NAMED)?)\s*<([^>]+)>", re.IGNORECASE)
+
+# Canonicalization: string literals and IRIs are kept verbatim, whitespace
+# between tokens collapses and comments (which run to end of line) are dropped
+_TOKEN_RE = re.compile(
+    r'"""(?:[^"\\]|\\.|"(?!""))*"""'
+    r"|'''(?:[^'\\]|\\.|'(?!''))*'''"
+    r'|"(?:[^"\\\n]|\\.)*"'
+    r"|'(?:[^'\\\n]|\\.)*'"
+    r'|<[^<>"{}|^`\\\s]*>'
+    r"|(?P<gap>(?:\s|(?<!\\)#[^\n]*)+)"
+)
+_PROLOGUE_RE = re.compile(rf"^(?:(?:{_PROLOGUE_DECL})\s*)+", re.IGNORECASE)
+_PROLOGUE_DECL_RE = re.compile(_PROLOGUE_DECL, re.IGNORECASE)
+
+def _canonical_token(match: "re.Match[str]") -> str:
+    """A run of whitespace and comments becomes one space; literals and IRIs are unchanged"""
+    return " " if match.group("gap") else match.group(0)
+
+def _canonicalize(query: str) -> str:
+    """Normalize a query so logically identical reads share a cache key"""
+    query = _TOKEN_RE.sub(_canonical_token, query).strip()
+    prologue = _PROLOGUE_RE.match(query)
+    if prologue:
+        decls = sorted(_PROLOGUE_DECL_RE.findall(prologue.group(0)))
+        query = " ".join(decls + [query[prologue.end():]])
+    return query
+
+def _referenced_graphs(query: str) -> FrozenSet[str]:
+    """Named graph URIs a query reads from or writes to"""
+    return frozenset(_GRAPH_RE.findall(query))
+
+def _bind(template: str, **bindings: Any) -> str:
+    """Fill a query template; rdflib terms are bound as escaped N3, strings are pre-serialized"""
+    return template.format(**{
+        name: value.n3() if isinstance(value, Identifier) else value
+        for name, value in bindings.items()
+    })
+
+# Query templates keep constant text so Virtuoso and the result cache see stable queries
+_PREFIXES = (
+    f"PREFIX nuj: <{_NUJ_STR}>\n"
+    f"PREFIX rdfs: <{RDFS}>\n"
+)
+
+_INSERT_PLATFORM = _PREFIXES + """
+INSERT DATA {{
+  GRAPH <https://nuj.org.uk/monitor/platforms> {{
+    {platform} a nuj:Platform ;
+      rdfs:label {displayName} ;
+      nuj:name {name} ;
+      nuj:apiEnabled {apiEnabled} ;
+      nuj:monitoringActive {monitoringActive} ;
+      nuj:createdAt {createdAt} .
+  }}
+}}
+"""
+
+# Buffered policy changes (N-Triples) are written together in a single INSERT DATA
+_INSERT_POLICY_CHANGES = """
+INSERT DATA {{
+  GRAPH <https://nuj.org.uk/monitor/changes> {{
+{triples}  }}
+}}
+"""
+
+_SEVERITY_FILTER = "FILTER (?severity = {severity})"
+_PLATFORM_LABEL_FILTER = "FILTER (?platformLabel = {platformLabel})"
+
+# The detectedAt range is the most selective pattern, so it leads and the
+# select-option pins that join order instead of scanning every change first
+_RECENT_CHANGES_QUERY = 'define sql:select-option "order"\n' + _PREFIXES + """
+SELECT ?change ?platform ?platformLabel ?severity ?confidence ?summary ?detectedAt
+WHERE {{
+  GRAPH <https://nuj.org.uk/monitor/changes> {{
+    ?change nuj:detectedAt ?detectedAt .
+    FILTER (?detectedAt > {detectedAt})
+
+    ?change a nuj:PolicyChange ;
+      nuj:affectsPlatform ?platform ;
+      nuj:severity ?severity ;
+      nuj:confidenceScore ?confidence ;
+      nuj:changeSummary ?summary .
+
+    ?platform rdfs:label ?platformLabel .
+    {filters}
+  }}
+}}
+ORDER BY DESC(?detectedAt)
+LIMIT 100
+"""
+
+# Platform statistics are two independent aggregates; joining them in one
+# query would count over the cross product of all changes and critical changes
+_PLATFORM_TOTALS_QUERY = _PREFIXES + """
+SELECT
+  (COUNT(DISTINCT ?change) as ?totalChanges)
+  (AVG(?confidence) as ?avgConfidence)
+WHERE {{
+  GRAPH <https://nuj.org.uk/monitor/changes> {{
+    ?change a nuj:PolicyChange ;
+      nuj:affectsPlatform {platform} ;
+      nuj:confidenceScore ?confidence .
+  }}
+}}
+"""
+
+_PLATFORM_CRITICAL_QUERY = _PREFIXES + """
+SELECT (COUNT(DISTINCT ?change) as ?criticalChanges)
+WHERE {{
+  GRAPH <https://nuj.org.uk/monitor/changes> {{
+    ?change a nuj:PolicyChange ;
+      nuj:affectsPlatform {platform} ;
+      nuj:severity "critical" .
+  }}
+}}
+"""
+
+# Virtuoso free-text index lookup; init-virtuoso.sql enables the index for all literals
+_FULL_TEXT_MATCH = "?summary bif:contains {textQuery} ."
+# Fixed query that only compiles on endpoints supporting bif:contains
+_FULL_TEXT_PROBE = 'ASK { ?s ?p ?o . ?o bif:contains "nuj" }'
+# Free-text phrases keep only words, so quotes, wildcards and operators never reach bif:contains
+_FREE_TEXT_WORD_RE = re.compile(r"\w+")
+# Portable fallback for endpoints without bif:contains: one alternation, compiled once per query
+_KEYWORD_FILTER = 'FILTER (REGEX(?summary, {pattern}, "i"))'
+# XPath regex metacharacters; re.escape would also escape characters XPath rejects
+_XPATH_META_RE = re.compile(r"([.\\?*+{}()\[\]^$|-])")
+
+def _keyword_pattern(keywords: List[str]) -> str:
+    """SPARQL (XPath) regex matching any keyword literally"""
+    return "|".join(_XPATH_META_RE.sub(r"\\\1", kw) for kw in keywords)
+
+def _free_text_query(keywords: List[str]) -> str:
+    """Virtuoso free-text expression matching any keyword as a whole phrase, empty if none has words"""
+    phrases = (" ".join(_FREE_TEXT_WORD_RE.findall(kw)) for kw in keywords)
+    return " OR ".join(f'"{phrase}"' for phrase in phrases if phrase)
+
+_SEMANTIC_SEARCH_QUERY = _PREFIXES + """
+SELECT ?change ?platform ?severity ?summary ?detectedAt
+WHERE {{
+  GRAPH <https://nuj.org.uk/monitor/changes> {{
+    ?change a nuj:PolicyChange ;
+      nuj:affectsPlatform ?platform ;
+      nuj:severity ?severity ;
+      nuj:changeSummary ?summary ;
+      nuj:detectedAt ?detectedAt .
+
+    {match}
+  }}
+
+  ?platform rdfs:label ?platformLabel .
+}}
+ORDER BY DESC(?detectedAt)
+LIMIT 50
+"""
+
+# Statuses worth resending a batch unchanged for; other 4xx mean Virtuoso refused its content
+_RETRY_STATUSES = frozenset({401, 403, 408, 429})
+# Ceiling on the exponential backoff between failed batch flushes
+_MAX_FLUSH_BACKOFF = 30.0
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed flush may succeed if the same batch is sent again"""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status in _RETRY_STATUSES
+    return True
+
+_EXPORT_GRAPH_QUERY = """
+CONSTRUCT {{ ?s ?p ?o }}
+WHERE {{
+  GRAPH {graph} {{ ?s ?p ?o }}
+}}
+"""
+
 @dataclass
 class VirtuosoConfig:
     host: str = "localhost"
@@ -24,6 +260,11 @@ class VirtuosoConfig:
     username: str = "dba"
     password: str = "dba"
     default_graph: str = "https://nuj.org.uk/monitor/default-graph"
+    full_text_search: bool = True
+    insert_batch_size: int = 256
+    insert_flush_interval: float = 0.5
+    insert_max_pending: int = 4096
+    insert_max_retries: int = 8
 
 class VirtuosoAdapter:
     """Adapter for Virtuoso RDF triple store"""
@@ -31,10 +272,83 @@ class VirtuosoAdapter:
     def __init__(self, config: VirtuosoConfig):
         self.config = config
         self.sparql_endpoint = f"https://{config.host}:{config.http_port}/sparql"
-        self.client = httpx.AsyncClient()
+        # Whether the endpoint supports bif:contains; unknown until first probed
+        self._full_text: Optional[bool] = None
+        # Policy change triples waiting to be written in one batched INSERT DATA
+        self._pending: List[str] = []
+        self._pending_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_failures = 0
+        self._flush_retry_at = 0.0
+        self._closing = asyncio.Event()
+        # Result cache: key -> (named graphs referenced, raw SPARQL JSON body)
+        self._cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        self._cache_lock = asyncio.Lock()
+        self._cache_generation = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled client, looked up per request so it is never held closed"""
+        return _get_client()
 
     async def execute_sparql(self, query: str, **kwargs) -> Dict[str, Any]:
-        """Execute SPARQL query"""
+        """Execute SPARQL query, serving repeated reads from the result cache"""
+        if _UPDATE_RE.match(query.strip()):
+            result = await self._post_sparql(query, **kwargs)
+            await self.invalidate_graphs(_referenced_graphs(query))
+            return result
+
+        # Reads should see buffered changes, but a failing write must not fail the read
+        await self._flush_when_due()
+
+        key = hashlib.blake2b(
+            _canonicalize(query).encode() + repr(sorted(kwargs.items())).encode()
+        ).digest()
+        async with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache_hits += 1
+                # Decoded per hit so callers never share, and can't corrupt, a cached result
+                return json.loads(entry[1])
+            self._cache_misses += 1
+            generation = self._cache_generation
+
+        body = await self._post_sparql_raw(query, **kwargs)
+
+        async with self._cache_lock:
+            # Skip storing if an update landed while this read was in flight
+            if generation == self._cache_generation:
+                self._cache[key] = (_referenced_graphs(query), body)
+        return json.loads(body)
+
+    async def invalidate_graphs(self, graphs: FrozenSet[str]) -> None:
+        """Drop cached results that read any of the given named graphs"""
+        # Entries without a named graph read the default graph, so drop them too
+        async with self._cache_lock:
+            self._cache_generation += 1
+            stale = [
+                key for key, (cached_graphs, _) in list(self._cache.items())
+                if not graphs or not cached_graphs or cached_graphs & graphs
+            ]
+            for key in stale:
+                self._cache.pop(key, None)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Result cache hit/miss counters"""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._cache),
+        }
+
+    async def _post_sparql(self, query: str, **kwargs) -> Dict[str, Any]:
+        """POST a query or update to the SPARQL endpoint"""
+        return json.loads(await self._post_sparql_raw(query, **kwargs))
+
+    async def _post_sparql_raw(self, query: str, **kwargs) -> bytes:
+        """POST a query or update to the SPARQL endpoint, returning the undecoded body"""
         response = await self.client.post(
             self.sparql_endpoint,
             data={
@@ -45,7 +359,7 @@ class VirtuosoAdapter:
             auth=(self.config.username, self.config.password)
         )
         response.raise_for_status()
-        return response.json()
+        return response.content
 
     async def insert_platform(
         self,
@@ -57,24 +371,15 @@ class VirtuosoAdapter:
         policy_urls: List[str]
     ) -> bool:
         """Insert platform as RDF triples"""
-        platform_uri = PLATFORM[platform_id]
-
-        query = f"""
-        PREFIX nuj: <{NUJ}>
-        PREFIX platform: <{PLATFORM}>
-        PREFIX rdfs: <{RDFS}>
-
-        INSERT DATA {{
-          GRAPH <https://nuj.org.uk/monitor/platforms> {{
-            {platform_uri.n3()} a nuj:Platform ;
-              rdfs:label "{display_name}" ;
-              nuj:name "{name}" ;
-              nuj:apiEnabled {str(api_enabled).lower()} ;
-              nuj:monitoringActive {str(monitoring_active).lower()} ;
-              nuj:createdAt "{datetime.utcnow().isoformat()}"^^xsd:dateTime .
-          }}
-        }}
-        """
+        query = _bind(
+            _INSERT_PLATFORM,
+            platform=_uri_n3(_PLATFORM_STR, platform_id),
+            displayName=Literal(display_name),
+            name=Literal(name),
+            apiEnabled=_BOOL_N3[bool(api_enabled)],
+            monitoringActive=_BOOL_N3[bool(monitoring_active)],
+            createdAt=Literal(datetime.utcnow())
+        )
 
         await self.execute_sparql(query)
         return True
@@ -90,34 +395,127 @@ class VirtuosoAdapter:
         requires_notification: bool,
         detected_at: datetime
     ) -> bool:
-        """Insert policy change as RDF"""
+        """Queue policy change for the next batched RDF insert"""
         change_uri = CHANGE[change_id]
-        platform_uri = PLATFORM[platform_id]
-        policy_uri = POLICY[policy_document_id]
-
-        query = f"""
-        PREFIX nuj: <{NUJ}>
-        PREFIX change: <{CHANGE}>
-        PREFIX policy: <{POLICY}>
-        PREFIX platform: <{PLATFORM}>
-
-        INSERT DATA {{
-          GRAPH <https://nuj.org.uk/monitor/changes> {{
-            {change_uri.n3()} a nuj:PolicyChange ;
-              nuj:affectsPlatform {platform_uri.n3()} ;
-              nuj:affectsPolicy {policy_uri.n3()} ;
-              nuj:severity "{severity}" ;
-              nuj:confidenceScore {confidence_score} ;
-              nuj:changeSummary "{change_summary.replace('"', '\\"')}" ;
-              nuj:requiresNotification {str(requires_notification).lower()} ;
-              nuj:detectedAt "{detected_at.isoformat()}"^^xsd:dateTime .
-          }}
-        }}
-        """
-
-        await self.execute_sparql(query)
+        g = Graph()
+        g.add((change_uri, RDF.type, NUJ.PolicyChange))
+        g.add((change_uri, NUJ.affectsPlatform, PLATFORM[platform_id]))
+        g.add((change_uri, NUJ.affectsPolicy, POLICY[policy_document_id]))
+        g.add((change_uri, NUJ.severity, Literal(severity)))
+        # Via Decimal, so floats like 1e-07 are written in xsd:decimal's plain notation
+        g.add((change_uri, NUJ.confidenceScore, Literal(Decimal(str(confidence_score)))))
+        g.add((change_uri, NUJ.changeSummary, Literal(change_summary)))
+        g.add((change_uri, NUJ.requiresNotification, Literal(bool(requires_notification))))
+        g.add((change_uri, NUJ.detectedAt, Literal(detected_at)))
+        # N-Triples escapes every literal; sorting the lines makes the output deterministic.
+        # This per-call Graph + serialize + sort is slower than the str.format template
+        # used for the other queries (whose Literal.n3() escaping is already correct):
+        # it trades speed on this insert path for rdflib-owned serialization.
+        triples = "".join(sorted(g.serialize(format="nt").splitlines(keepends=True)))
+
+        async with self._pending_lock:
+            # Refuse rather than buffer without bound while Virtuoso keeps failing
+            if len(self._pending) >= self.config.insert_max_pending:
+                logger.error(
+                    "Policy change buffer full (%d pending), not queueing %s",
+                    len(self._pending), change_id
+                )
+                return False
+            self._pending.append(triples)
+            batch_full = len(self._pending) >= self.config.insert_batch_size
+            # The timer also retries a batch that a full-buffer flush had to requeue
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_after_delay())
+
+        if batch_full:
+            await self._flush_when_due()
         return True
 
+    async def flush(self) -> None:
+        """Write all buffered policy changes in a single INSERT DATA request"""
+        async with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            await self._write_batch(batch)
+        except asyncio.CancelledError:
+            await self._requeue(batch)
+            raise
+        except Exception as e:
+            await self._retry_later(batch, e)
+            raise
+        self._flush_failures = 0
+        self._flush_retry_at = 0.0
+
+    async def _write_batch(self, batch: List[str]) -> None:
+        """INSERT DATA a batch, bisecting a rejected one so only the changes at fault are dropped"""
+        try:
+            await self.execute_sparql(
+                _bind(_INSERT_POLICY_CHANGES, triples="".join(batch))
+            )
+        except httpx.HTTPStatusError as e:
+            if _is_transient(e):
+                raise
+            if len(batch) == 1:
+                logger.error("Dropping policy change rejected by Virtuoso: %s\n%s", e, batch[0])
+                return
+            # Halves that were already written are harmless to resend: RDF graphs are sets
+            middle = len(batch) // 2
+            await self._write_batch(batch[:middle])
+            await self._write_batch(batch[middle:])
+
+    async def _retry_later(self, batch: List[str], error: Exception) -> None:
+        """Requeue a batch that failed transiently, backing off until retries run out"""
+        async with self._pending_lock:
+            self._flush_failures += 1
+            if self._flush_failures > self.config.insert_max_retries:
+                logger.error(
+                    "Dropping %d buffered policy changes after %d failed flushes: %s",
+                    len(batch), self._flush_failures, error
+                )
+                self._flush_failures = 0
+                return
+            self._pending[:0] = batch
+            backoff = self.config.insert_flush_interval * 2 ** self._flush_failures
+            self._flush_retry_at = time.monotonic() + min(backoff, _MAX_FLUSH_BACKOFF)
+
+    async def _requeue(self, batch: List[str]) -> None:
+        """Put an unwritten batch back at the front of the buffer"""
+        async with self._pending_lock:
+            self._pending[:0] = batch
+
+    async def _flush_when_due(self) -> None:
+        """Flush unless backing off after a failure; errors are logged, not raised"""
+        if not self._pending or time.monotonic() < self._flush_retry_at:
+            return
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning("Batched policy change flush failed: %s", e)
+
+    async def _flush_after_delay(self) -> None:
+        """Flush buffered changes every flush interval, or after backoff, until none remain"""
+        while True:
+            delay = max(
+                self.config.insert_flush_interval,
+                self._flush_retry_at - time.monotonic()
+            )
+            # close() cuts the wait short so it never sits out a long backoff
+            try:
+                await asyncio.wait_for(self._closing.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning("Batched policy change flush failed: %s", e)
+            async with self._pending_lock:
+                if not self._pending or self._closing.is_set():
+                    self._flush_task = None
+                    return
+
     async def query_recent_changes(
         self,
         days: int = 30,
@@ -125,124 +523,99 @@ class VirtuosoAdapter:
         platform: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Query recent policy changes"""
-        severity_filter = f'FILTER (?severity = "{severity}")' if severity else ""
-        platform_filter = f'FILTER (?platformLabel = "{platform}")' if platform else ""
-
-        query = f"""
-        PREFIX nuj: <{NUJ}>
-        PREFIX rdfs: <{RDFS}>
-
-        SELECT ?change ?platform ?platformLabel ?severity ?confidence ?summary ?detectedAt
-        WHERE {{
-          GRAPH <https://nuj.org.uk/monitor/changes> {{
-            ?change a nuj:PolicyChange ;
-              nuj:affectsPlatform ?platform ;
-              nuj:severity ?severity ;
-              nuj:confidenceScore ?confidence ;
-              nuj:changeSummary ?summary ;
-              nuj:detectedAt ?detectedAt .
-
-            ?platform rdfs:label ?platformLabel .
-
-            FILTER (?detectedAt > "{(datetime.utcnow() - timedelta(days=days)).isoformat()}"^^xsd:dateTime)
-            {severity_filter}
-            {platform_filter}
-          }}
-        }}
-        ORDER BY DESC(?detectedAt)
-        LIMIT 100
-        """
+        # Day granularity keeps the query text, and so its cache key, stable all day
+        cutoff = (datetime.utcnow() - timedelta(days=days)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        filters = []
+        if severity:
+            filters.append(_bind(_SEVERITY_FILTER, severity=Literal(severity)))
+        if platform:
+            filters.append(_bind(_PLATFORM_LABEL_FILTER, platformLabel=Literal(platform)))
+
+        query = _bind(
+            _RECENT_CHANGES_QUERY,
+            detectedAt=Literal(cutoff),
+            filters="\n    ".join(filters)
+        )
 
         result = await self.execute_sparql(query)
         return result.get("results", {}).get("bindings", [])
 
     async def query_platform_statistics(self, platform_id: str) -> Dict[str, Any]:
         """Get statistics for a platform"""
-        platform_uri = PLATFORM[platform_id]
-
-        query = f"""
-        PREFIX nuj: <{NUJ}>
-
-        SELECT
-          (COUNT(DISTINCT ?change) as ?totalChanges)
-          (COUNT(DISTINCT ?criticalChange) as ?criticalChanges)
-          (AVG(?confidence) as ?avgConfidence)
-        WHERE {{
-          {{
-            SELECT ?change ?confidence WHERE {{
-              GRAPH <https://nuj.org.uk/monitor/changes> {{
-                ?change a nuj:PolicyChange ;
-                  nuj:affectsPlatform {platform_uri.n3()} ;
-                  nuj:confidenceScore ?confidence .
-              }}
-            }}
-          }}
-          OPTIONAL {{
-            ?criticalChange nuj:severity "critical" ;
-              nuj:affectsPlatform {platform_uri.n3()} .
-          }}
-        }}
-        """
+        platform = _uri_n3(_PLATFORM_STR, platform_id)
+        results = await asyncio.gather(
+            self.execute_sparql(_bind(_PLATFORM_TOTALS_QUERY, platform=platform)),
+            self.execute_sparql(_bind(_PLATFORM_CRITICAL_QUERY, platform=platform))
+        )
 
-        result = await self.execute_sparql(query)
-        bindings = result.get("results", {}).get("bindings", [])
-        if bindings:
-            return bindings[0]
-        return {}
+        stats: Dict[str, Any] = {}
+        for result in results:
+            bindings = result.get("results", {}).get("bindings", [])
+            if bindings:
+                stats.update(bindings[0])
+        return stats
 
     async def semantic_search(self, keywords: List[str]) -> List[Dict[str, Any]]:
         """Semantic search across all policy changes"""
-        keyword_filter = " OR ".join([f'CONTAINS(?summary, "{kw}")' for kw in keywords])
-
-        query = f"""
-        PREFIX nuj: <{NUJ}>
-        PREFIX rdfs: <{RDFS}>
-
-        SELECT ?change ?platform ?severity ?summary ?detectedAt
-        WHERE {{
-          GRAPH <https://nuj.org.uk/monitor/changes> {{
-            ?change a nuj:PolicyChange ;
-              nuj:affectsPlatform ?platform ;
-              nuj:severity ?severity ;
-              nuj:changeSummary ?summary ;
-              nuj:detectedAt ?detectedAt .
-
-            FILTER ({keyword_filter})
-          }}
-
-          ?platform rdfs:label ?platformLabel .
-        }}
-        ORDER BY DESC(?detectedAt)
-        LIMIT 50
-        """
+        keywords = [kw.strip() for kw in keywords if kw and kw.strip()]
+        if not keywords:
+            return []
 
-        result = await self.execute_sparql(query)
-        return result.get("results", {}).get("bindings", [])
+        text_query = _free_text_query(keywords)
+        if text_query and self.config.full_text_search and await self._full_text_supported():
+            match = _bind(_FULL_TEXT_MATCH, textQuery=Literal(text_query))
+        else:
+            match = _bind(_KEYWORD_FILTER, pattern=Literal(_keyword_pattern(keywords)))
 
-    async def export_graph(self, graph_uri: str, format: str = "turtle") -> str:
-        """Export entire named graph"""
-        query = f"""
-        CONSTRUCT {{ ?s ?p ?o }}
-        WHERE {{
-          GRAPH <{graph_uri}> {{ ?s ?p ?o }}
-        }}
-        """
+        result = await self.execute_sparql(_bind(_SEMANTIC_SEARCH_QUERY, match=match))
+        return result.get("results", {}).get("bindings", [])
 
-        response = await self.client.post(
+    async def _full_text_supported(self) -> bool:
+        """Whether the endpoint accepts bif:contains, probed once per adapter"""
+        if self._full_text is None:
+            try:
+                await self._post_sparql(_FULL_TEXT_PROBE)
+                self._full_text = True
+            except httpx.HTTPStatusError as e:
+                # Only a rejected probe answers the question; outages leave it open
+                if e.response.status_code != 400:
+                    raise
+                logger.info("bif:contains unsupported at %s, searching with REGEX", self.sparql_endpoint)
+                self._full_text = False
+        return self._full_text
+
+    async def export_graph(
+        self,
+        graph_uri: str,
+        format: str = "turtle",
+        chunk_size: int = 65536
+    ) -> AsyncIterator[bytes]:
+        """Export entire named graph, streamed in chunks rather than buffered"""
+        query = _bind(_EXPORT_GRAPH_QUERY, graph=URIRef(graph_uri))
+        await self._flush_when_due()
+
+        async with self.client.stream(
+            "POST",
             self.sparql_endpoint,
             data={"query": query, "format": f"application/{format}"},
             auth=(self.config.username, self.config.password)
-        )
-        return response.text
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
 
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """Flush buffered changes; the shared HTTP client is closed by aclose_client()"""
+        # Let an in-flight timer flush finish rather than cancel it mid-request
+        self._closing.set()
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.flush()
 
 # Example usage
 async def main():
-    from datetime import timedelta
-
     config = VirtuosoConfig()
     adapter = VirtuosoAdapter(config)
 
@@ -259,6 +632,7 @@ async def main():
     print(f"Twitter stats: {stats}")
 
     await adapter.close()
+    await aclose_client()
 
 if __name__ == "__main__":
     import asyncio
@@ -4,13 +4,19 @@ Automatically discovers and configures SMTP settings
 """
 
 import asyncio
-import smtplib
-import dns.resolver
-from typing import Optional, Dict, Tuple
-from dataclasses import dataclass
+import aiodns
+import aiosmtplib
+import pycares
+import ssl
+from cachetools import TTLCache
+from typing import Optional, Dict, Tuple, List
+from dataclasses import dataclass, replace
 from email.mime.text import MIMEText
 import socket
 
+# Sentinel distinguishing "not cached" from a cached None result
+_MISSING = object()
+
 @dataclass
 class SMTPConfig:
     host: str
@@ -38,6 +44,17 @@ class SMTPAutoConfig:
         {"host": "mail.{domain}", "port": 587, "use_tls": True, "use_ssl": False},
     ]
 
+    # Maximum number of SMTP probes in flight at once
+    MAX_CONCURRENT_PROBES = 6
+
+    # Resolved MX hosts, and probe outcomes keyed by (host, port, use_tls, use_ssl).
+    # Probe failures are cached too, briefly, so dead hosts don't cost a timeout each time.
+    _mx_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+    _probe_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+    # Built once so each connection skips reloading the system CA bundle
+    _SSL_CTX = ssl.create_default_context()
+
     @staticmethod
     async def discover_smtp(email: str) -> Optional[SMTPConfig]:
         """
@@ -51,37 +68,67 @@ class SMTPAutoConfig:
         """
         domain = email.split('@')[1]
 
-        # Try MX record lookup
+        # MX record first, then common configurations
+        candidates: List[Tuple[str, int, bool, bool]] = []
         mx_host = await SMTPAutoConfig._get_mx_record(domain)
         if mx_host:
-            config = await SMTPAutoConfig._test_smtp_connection(mx_host)
-            if config:
-                return config
-
-        # Try common configurations
+            candidates.append((mx_host, 587, True, False))
         for template in SMTPAutoConfig.COMMON_CONFIGS:
-            host = template["host"].format(domain=domain)
-            config = await SMTPAutoConfig._test_smtp_connection(
-                host,
+            candidates.append((
+                template["host"].format(domain=domain),
                 template["port"],
                 template["use_tls"],
                 template["use_ssl"]
-            )
-            if config:
-                return config
+            ))
 
-        return None
+        return await SMTPAutoConfig._first_working(list(dict.fromkeys(candidates)))
+
+    @staticmethod
+    async def _first_working(
+        candidates: List[Tuple[str, int, bool, bool]]
+    ) -> Optional[SMTPConfig]:
+        """Probe candidates concurrently; return the first working one in candidate order"""
+        semaphore = asyncio.Semaphore(SMTPAutoConfig.MAX_CONCURRENT_PROBES)
+
+        async def probe(candidate: Tuple[str, int, bool, bool]) -> Optional[SMTPConfig]:
+            async with semaphore:
+                return await SMTPAutoConfig._test_smtp_connection(*candidate)
+
+        tasks = [asyncio.create_task(probe(candidate)) for candidate in candidates]
+        try:
+            # Probes run in parallel, but a faster generic host must not beat the domain's own MX
+            for task in tasks:
+                config = await task
+                if config:
+                    return config
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
 
     @staticmethod
     async def _get_mx_record(domain: str) -> Optional[str]:
         """Get MX record for domain"""
+        mx_host = SMTPAutoConfig._mx_cache.get(domain)
+        if mx_host:
+            return mx_host
         try:
-            answers = dns.resolver.resolve(domain, 'MX')
+            # query() is deprecated since aiodns 3.5; the resolver is closed after each
+            # lookup (answers are cached for an hour) so no channel outlives its event loop
+            async with aiodns.DNSResolver() as resolver:
+                result = await resolver.query_dns(domain, 'MX')
             # Return highest priority MX record
-            mx_records = sorted([(r.preference, str(r.exchange)) for r in answers])
-            return mx_records[0][1].rstrip('.') if mx_records else None
+            mx_records = sorted(
+                (r.data.priority, r.data.exchange) for r in result.answer
+                if isinstance(r.data, pycares.MXRecordData)
+            )
         except Exception:
             return None
+        if not mx_records:
+            return None
+        mx_host = mx_records[0][1].rstrip('.')
+        SMTPAutoConfig._mx_cache[domain] = mx_host
+        return mx_host
 
     @staticmethod
     async def _test_smtp_connection(
@@ -92,22 +139,36 @@ class SMTPAutoConfig:
         timeout: int = 10
     ) -> Optional[SMTPConfig]:
         """Test SMTP connection"""
+        key = (host, port, use_tls, use_ssl)
+        cached = SMTPAutoConfig._probe_cache.get(key, _MISSING)
+        if cached is _MISSING:
+            cached = await SMTPAutoConfig._probe_smtp(host, port, use_tls, use_ssl, timeout)
+            SMTPAutoConfig._probe_cache[key] = cached
+        # Callers fill in credentials, so never hand out the cached instance
+        return replace(cached) if cached else None
+
+    @staticmethod
+    async def _probe_smtp(
+        host: str,
+        port: int,
+        use_tls: bool,
+        use_ssl: bool,
+        timeout: int
+    ) -> Optional[SMTPConfig]:
+        """Connect to an SMTP server and check whether it requires auth"""
         try:
-            if use_ssl:
-                server = smtplib.SMTP_SSL(host, port, timeout=timeout)
-            else:
-                server = smtplib.SMTP(host, port, timeout=timeout)
-                if use_tls:
-                    server.starttls()
-
-            # Test if auth is required
+            server = await SMTPAutoConfig._connect(host, port, use_tls, use_ssl, timeout)
             try:
-                server.noop()
-                auth_required = False
-            except smtplib.SMTPException:
-                auth_required = True
+                # Test if auth is required
+                try:
+                    await server.noop()
+                    auth_required = False
+                except aiosmtplib.SMTPException:
+                    auth_required = True
 
-            server.quit()
+                await server.quit()
+            finally:
+                server.close()
 
             return SMTPConfig(
                 host=host,
@@ -119,6 +180,32 @@ class SMTPAutoConfig:
         except Exception:
             return None
 
+    @staticmethod
+    async def _connect(
+        host: str,
+        port: int,
+        use_tls: bool,
+        use_ssl: bool,
+        timeout: int = 10
+    ) -> aiosmtplib.SMTP:
+        """Open an SMTP session, upgrading with STARTTLS when configured"""
+        server = aiosmtplib.SMTP(
+            hostname=host,
+            port=port,
+            timeout=timeout,
+            use_tls=use_ssl,
+            start_tls=False,
+            tls_context=SMTPAutoConfig._SSL_CTX
+        )
+        await server.connect()
+        if use_tls:
+            try:
+                await server.starttls()
+            except BaseException:
+                server.close()
+                raise
+        return server
+
     @staticmethod
     async def test_credentials(
         config: SMTPConfig,
@@ -127,15 +214,14 @@ class SMTPAutoConfig:
     ) -> bool:
         """Test SMTP credentials"""
         try:
-            if config.use_ssl:
-                server = smtplib.SMTP_SSL(config.host, config.port, timeout=10)
-            else:
-                server = smtplib.SMTP(config.host, config.port, timeout=10)
-                if config.use_tls:
-                    server.starttls()
-
-            server.login(username, password)
-            server.quit()
+            server = await SMTPAutoConfig._connect(
+                config.host, config.port, config.use_tls, config.use_ssl
+            )
+            try:
+                await server.login(username, password)
+                await server.quit()
+            finally:
+                server.close()
             return True
         except Exception:
             return False
@@ -155,18 +241,18 @@ class SMTPAutoConfig:
             msg['From'] = from_email
             msg['To'] = to_email
 
-            if config.use_ssl:
-                server = smtplib.SMTP_SSL(config.host, config.port, timeout=10)
-            else:
-                server = smtplib.SMTP(config.host, config.port, timeout=10)
-                if config.use_tls:
-                    server.starttls()
+            server = await SMTPAutoConfig._connect(
+                config.host, config.port, config.use_tls, config.use_ssl
+            )
 
-            if config.auth_required and config.username and config.password:
-                server.login(config.username, config.password)
+            try:
+                if config.auth_required and config.username and config.password:
+                    await server.login(config.username, config.password)
 
-            server.send_message(msg)
-            server.quit()
+                await server.send_message(msg)
+                await server.quit()
+            finally:
+                server.close()
             return True
         except Exception as e:
             print(f"Test email failed: {e}")